@@ -1,7 +1,22 @@
+import copy
+from functools import lru_cache
+
 from .compiler import compile_messages
 from .resource import FtlResource
 from .utils import ATTRIBUTE_SEPARATOR, TERM_SIGIL
 
+# Maximum number of (message_id, args) combinations that
+# FluentBundle.format remembers the output for, when cache_format=True.
+FORMAT_CACHE_SIZE = 1024
+
+# Argument types for which equal values always produce equal output,
+# so that they can be used in cache keys. (Many other types, such as
+# float, Decimal, datetime and FluentNumber have values that compare
+# equal but format differently)
+CACHEABLE_ARG_TYPES = (str, int)
+
+_UNCACHEABLE = object()
+
 
 class FluentBundle:
     """
@@ -16,7 +31,7 @@ class FluentBundle:
 
     """
 
-    def __init__(self, locale, resources, functions=None, use_isolating=True, escapers=None):
+    def __init__(self, locale, resources, functions=None, use_isolating=True, escapers=None, cache_format=False):
         self.locale = locale
         compiled_ftl = compile_messages(
             locale,
@@ -27,25 +42,33 @@ class FluentBundle:
         )
         self._compiled_messages = compiled_ftl.message_functions
         self._compilation_errors = compiled_ftl.errors
+        # Custom functions and escapers could return different output for the
+        # same arguments, so we can only cache when they are not used.
+        if cache_format and not functions and not escapers:
+            self._format_cached = make_cached_format(self._compiled_messages)
+        else:
+            self._format_cached = None
 
     @classmethod
-    def from_string(cls, locale, text, functions=None, use_isolating=True, escapers=None):
+    def from_string(cls, locale, text, functions=None, use_isolating=True, escapers=None, cache_format=False):
         return cls(
             locale,
             [FtlResource.from_string(text)],
             use_isolating=use_isolating,
             functions=functions,
             escapers=escapers,
+            cache_format=cache_format,
         )
 
     @classmethod
-    def from_files(cls, locale, filenames, functions=None, use_isolating=True, escapers=None):
+    def from_files(cls, locale, filenames, functions=None, use_isolating=True, escapers=None, cache_format=False):
         return cls(
             locale,
             [FtlResource.from_file(f) for f in filenames],
             use_isolating=use_isolating,
             functions=functions,
             escapers=escapers,
+            cache_format=cache_format,
         )
 
     def has_message(self, message_id):
@@ -54,8 +77,39 @@ class FluentBundle:
         return message_id in self._compiled_messages
 
     def format(self, message_id, args=None):
+        if self._format_cached is not None:
+            frozen_args = freeze_args(args)
+            if frozen_args is not _UNCACHEABLE:
+                retval, errors = self._format_cached(message_id, frozen_args)
+                # Copies, so that callers can't change what later callers get.
+                return retval, [copy.copy(error) for error in errors]
         errors = []
         return self._compiled_messages[message_id](args, errors), errors
 
     def check_messages(self):
         return self._compilation_errors
+
+
+def freeze_args(args):
+    """
+    Returns a hashable version of the message args dictionary,
+    or _UNCACHEABLE if it cannot be used as a cache key.
+    """
+    if args is None:
+        return None
+    if not isinstance(args, dict):
+        return _UNCACHEABLE
+    for val in args.values():
+        if type(val) not in CACHEABLE_ARG_TYPES:
+            return _UNCACHEABLE
+    return frozenset(args.items())
+
+
+def make_cached_format(message_functions):
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
+    def format_cached(message_id, frozen_args):
+        errors = []
+        args = None if frozen_args is None else dict(frozen_args)
+        return message_functions[message_id](args, errors), tuple(errors)
+
+    return format_cached
@@ -871,19 +871,24 @@ def rewriting_traverse(node, func):
     """
     Apply 'func' to node and all sub PythonAst nodes
     """
-    if isinstance(node, (PythonAst, PythonAstList)):
-        new_node = func(node)
-        if new_node is not node:
-            morph_into(node, new_node)
-        for k in node.child_elements:
-            rewriting_traverse(getattr(node, k), func)
-    elif isinstance(node, (list, tuple)):
-        for i in node:
-            rewriting_traverse(i, func)
-    elif isinstance(node, dict):
-        for k, v in node.items():
-            rewriting_traverse(k, func)
-            rewriting_traverse(v, func)
+    # This is called repeatedly by `simplify` for the whole module, so we use an
+    # explicit stack rather than recursion, to avoid the overhead of a Python
+    # frame for every node. Items are pushed in reverse so that nodes are
+    # visited in the same (pre-)order as a recursive traversal.
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (PythonAst, PythonAstList)):
+            new_node = func(node)
+            if new_node is not node:
+                morph_into(node, new_node)
+            stack.extend(reversed([getattr(node, k) for k in node.child_elements]))
+        elif isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            for k, v in reversed(list(node.items())):
+                stack.append(v)
+                stack.append(k)
 
 
 def morph_into(item, new_item):
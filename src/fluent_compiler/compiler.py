@@ -4,7 +4,8 @@
 import builtins
 import contextlib
 from collections import OrderedDict
-from functools import singledispatch
+from functools import lru_cache
+from types import MappingProxyType
 
 import attr
 import babel
@@ -38,15 +39,15 @@ from .errors import (
     FluentReferenceError,
 )
 from .escapers import EscaperJoin, RegisteredEscaper, escaper_for_message, escapers_compatible, identity, null_escaper
-from .types import FluentDateType, FluentNone, FluentNumber, FluentType
+from .types import FluentDateType, FluentFloat, FluentInt, FluentNone, FluentNumber, FluentType
 from .utils import (
     ATTRIBUTE_SEPARATOR,
     TERM_SIGIL,
-    args_match,
     ast_to_id,
     attribute_ast_to_id,
     display_location,
     inspect_function_args,
+    make_args_validator,
     reference_to_id,
     span_to_position,
 )
@@ -69,6 +70,12 @@ MESSAGE_FUNCTION_ARGS = [MESSAGE_ARGS_NAME, ERRORS_NAME]
 LOCALE_NAME = "locale"
 PLURAL_FORM_FOR_NUMBER_NAME = "plural_form_for_number"
 
+# Plural forms are memoized for these types. Decimal is excluded, because
+# Decimal("1") and Decimal("1.0") compare equal but can have different plural
+# forms.
+PLURAL_FORM_CACHE_SIZE = 256
+PLURAL_FORM_CACHEABLE_TYPES = frozenset([int, float, FluentInt, FluentFloat])
+
 CLDR_PLURAL_FORMS = {
     "zero",
     "one",
@@ -79,8 +86,13 @@ CLDR_PLURAL_FORMS = {
 }
 PROPERTY_EXTERNAL_ARG = "PROPERTY_EXTERNAL_ARG"
 
+# Shared read-only empty containers for the common case of calls with no
+# positional or keyword arguments.
+EMPTY_ARGS = ()
+EMPTY_KWARGS = MappingProxyType({})
 
-@attr.s
+
+@attr.s(slots=True)
 class CurrentEnvironment:
     # The parts of CompilerEnvironment that we want to mutate (and restore)
     # temporarily for some parts of a call chain.
@@ -91,7 +103,7 @@ class CurrentEnvironment:
     escaper = attr.ib(default=null_escaper)
 
 
-@attr.s
+@attr.s(slots=True)
 class CompilerEnvironment:
     locale = attr.ib()
     plural_form_function = attr.ib()
@@ -101,7 +113,7 @@ class CompilerEnvironment:
     escapers = attr.ib(default=None)
     functions = attr.ib(factory=dict)
     function_renames = attr.ib(factory=dict)
-    functions_arg_spec = attr.ib(factory=dict)
+    function_args_validators = attr.ib(factory=dict)
     message_ids_to_ast = attr.ib(factory=dict)
     term_ids_to_ast = attr.ib(factory=dict)
     current = attr.ib(factory=CurrentEnvironment)
@@ -118,15 +130,21 @@ class CompilerEnvironment:
         Context manager that modifies the 'current' attribute of the
         environment, restoring the old data at the end.
         """
-        # CurrentEnvironment only has immutable args at the moment, so the
-        # shallow copy returned by attr.evolve is fine.
-        old_current = self.current
-        self.current = attr.evolve(old_current, **replacements)
-        yield self
-        self.current = old_current
+        # This is used for every term reference and select expression, so we
+        # save and restore just the replaced fields, rather than creating a
+        # new CurrentEnvironment with attr.evolve.
+        current = self.current
+        saved = [(name, getattr(current, name)) for name in replacements]
+        for name, value in replacements.items():
+            setattr(current, name, value)
+        try:
+            yield self
+        finally:
+            for name, value in saved:
+                setattr(current, name, value)
 
     def modified_for_term_reference(self, term_args=None):
-        return self.modified(term_args=term_args if term_args is not None else {})
+        return self.modified(term_args=term_args if term_args is not None else EMPTY_KWARGS)
 
     def should_use_isolating(self):
         if self.current.escaper.use_isolating is None:
@@ -270,9 +288,13 @@ def messages_to_module(messages, locale, use_isolating=True, functions=None, esc
 
     # Plural form function
     plural_form_for_number_main = babel.plural.to_python(locale.plural_form)
+    # typed=True so that e.g. 1 and 1.0 are cached separately.
+    plural_form_for_number_cached = lru_cache(maxsize=PLURAL_FORM_CACHE_SIZE, typed=True)(plural_form_for_number_main)
 
     def plural_form_for_number(number):
         try:
+            if type(number) in PLURAL_FORM_CACHEABLE_TYPES:
+                return plural_form_for_number_cached(number)
             return plural_form_for_number_main(number)
         except TypeError:
             # This function can legitimately be passed strings if we incorrectly
@@ -285,8 +307,9 @@ def messages_to_module(messages, locale, use_isolating=True, functions=None, esc
         plural_form_function=plural_form_for_number,
         use_isolating=use_isolating,
         functions=functions,
-        functions_arg_spec={
-            name: inspect_function_args(func, name, function_arg_errors) for name, func in functions.items()
+        function_args_validators={
+            name: make_args_validator(name, inspect_function_args(func, name, function_arg_errors))
+            for name, func in functions.items()
         },
         message_ids_to_ast=message_ids_to_ast,
         term_ids_to_ast=term_ids_to_ast,
@@ -444,9 +467,12 @@ def traverse_ast(node, func, exclude_attributes=None):
             return func(list(map(visit, value)))
         return func(value)
 
-    # Use all attributes found on the node
+    # Use all attributes found on the node, except private ones, which are
+    # caches we have attached to the node (see get_pattern_elements_info)
     parts = vars(node).items()
     for name, value in parts:
+        if name.startswith("_"):
+            continue
         if exclude_attributes is not None and (type(node), name) in exclude_attributes:
             continue
         visit(value)
@@ -460,8 +486,8 @@ def contains_reference_cycle(msg, compiler_env):
     in the context of the other messages provided in compiler_env
     """
     # We traverse the AST starting from message, jumping to other messages and
-    # terms as necessary, and seeing if a path through the AST loops back to
-    # previously visited nodes at any point.
+    # terms as necessary, and seeing if a path through the AST jumps back to a
+    # message or term that is already on the current path.
 
     # This algorithm has some bugs compared to the runtime method in resolver.py
     # For example, a pair of conditionally mutually recursive messages:
@@ -483,9 +509,6 @@ def contains_reference_cycle(msg, compiler_env):
     # for this kind of thing though... so we are not too worried
     # about fixing this bug, since we are erring on the conservative side.
 
-    message_ids_to_ast = compiler_env.message_ids_to_ast
-    term_ids_to_ast = compiler_env.term_ids_to_ast
-
     # We exclude recursing into certain attributes, because we already cover
     # these recursions explicitly by jumping to a subnode for the case of
     # references.
@@ -498,61 +521,39 @@ def contains_reference_cycle(msg, compiler_env):
         (Term, "comment"),
     ]
 
-    # We need to keep track of visited nodes. If we use just a single set for
-    # each top level message, then things like this would be rejected:
-    #
-    #     message = { -term } { -term }
-    #
-    # because we would visit the term twice.
-    #
-    # So we have a stack of sets:
-    visited_node_stack = [set()]
-    # The top of this stack represents the set of nodes in the current path of
-    # visited nodes. We push a copy of the top set onto the stack when we
-    # traverse into a sub-node, and pop it off when we come back.
-
-    checks = []
+    # The current path is strictly LIFO, so instead of keeping a set of visited
+    # nodes for it (which would need copying whenever we jump to a sub-node, so
+    # that things like `message = { -term } { -term }` are not rejected), we
+    # set a `_resolving` flag on each message/term node while we are inside it.
+    found_cycle = []
+
+    def traverse_resolving(node):
+        node._resolving = True
+        try:
+            traverse_ast(node, checker, exclude_attributes=exclude_attributes)
+        finally:
+            node._resolving = False
 
     def checker(node):
-        if isinstance(node, BaseNode):
-            node_id = id(node)
-            if node_id in visited_node_stack[-1]:
-                checks.append(True)
-                return
-            visited_node_stack[-1].add(node_id)
-        else:
+        if found_cycle or not isinstance(node, (MessageReference, TermReference)):
             return
 
-        # The logic below duplicates the logic that is used for 'jumping' to
-        # different nodes (messages via a runtime function call, terms via
-        # inlining), including the fallback strategies that are used.
-        sub_node = None
-        if isinstance(node, (MessageReference, TermReference)):
-            ref_id = reference_to_id(node)
-            if ref_id in message_ids_to_ast:
-                sub_node = message_ids_to_ast[ref_id]
-            elif ref_id in term_ids_to_ast:
-                sub_node = term_ids_to_ast[ref_id]
-            elif node.attribute:
-                # No match for attribute, but compiler falls back to parent ref
-                # in this situation, so we have to as well.
-                parent_ref_id = reference_to_id(node, ignore_attributes=True)
-                if parent_ref_id in message_ids_to_ast:
-                    sub_node = message_ids_to_ast[parent_ref_id]
-                elif parent_ref_id in term_ids_to_ast:
-                    sub_node = term_ids_to_ast[parent_ref_id]
-
-        if sub_node is not None:
-            visited_node_stack.append(visited_node_stack[-1].copy())
-            traverse_ast(sub_node, checker, exclude_attributes=exclude_attributes)
-            if any(checks):
-                return
-            visited_node_stack.pop()
-
-        return
-
-    traverse_ast(msg, checker, exclude_attributes=exclude_attributes)
-    return any(checks)
+        # This uses the same logic as for 'jumping' to different nodes
+        # (messages via a runtime function call, terms via inlining),
+        # including the fallback strategies that are used.
+        sub_node = lookup_reference(node, compiler_env)[2]
+        if sub_node is None:
+            return
+        if getattr(sub_node, "_resolving", False):
+            found_cycle.append(True)
+            return
+        if sub_node.value is not None and get_pattern_constant(sub_node.value) is not None:
+            # Plain text can't contain references, so can't be part of a cycle.
+            return
+        traverse_resolving(sub_node)
+
+    traverse_resolving(msg)
+    return bool(found_cycle)
 
 
 # ----------------- Begin 'compile_expr' implementation ---------------------
@@ -561,10 +562,14 @@ def contains_reference_cycle(msg, compiler_env):
 # They convert FTL AST nodes (as created by fluent.syntax parser)
 # into Python expressions (in the form of our `codegen.PythonAst` objects).
 #
-# The first `compile_expr` function is decorated with `@singledispatch`,
-# so we can then dispatch to other functions based on the type of the first
-# argument. This is instead of a huge switch statement consisting of
-# `if isinstance(ast, XXX): handle_XXX(...)`, or other similar visitor patterns.
+# The first `compile_expr` function dispatches to other functions based on the
+# type of the first argument, using the `COMPILE_EXPR_HANDLERS` dictionary which
+# is populated by the `@register_compile_expr` decorator. This is instead of a
+# huge switch statement consisting of `if isinstance(ast, XXX):
+# handle_XXX(...)`, or other similar visitor patterns. We use a plain dict
+# lookup on the exact type, rather than `functools.singledispatch`, because
+# `compile_expr` is called for every FTL node, and the exact type is almost
+# always registered, so we only need to walk the MRO for the rare subclass.
 #
 # The basic structure is that each `compile_expr` returns a single
 # codegen.PythonAst object that corresponds to the passed in FTL AST (the first
@@ -648,7 +653,35 @@ def contains_reference_cycle(msg, compiler_env):
 # generated code, with $ for interpolations (interpreted loosely)
 
 
-@singledispatch
+COMPILE_EXPR_HANDLERS = {}
+
+
+def register_compile_expr(node_type):
+    """
+    Decorator that registers a function as the `compile_expr` implementation
+    for the FTL AST `node_type`.
+    """
+
+    def decorator(func):
+        COMPILE_EXPR_HANDLERS[node_type] = func
+        lookup_compile_expr_handler.cache_clear()
+        return func
+
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def lookup_compile_expr_handler(node_type):
+    """
+    Returns the `compile_expr` implementation for a type that is not itself
+    registered, but may be a subclass of a registered type, or None.
+    """
+    for cls in node_type.__mro__:
+        if cls in COMPILE_EXPR_HANDLERS:
+            return COMPILE_EXPR_HANDLERS[cls]
+    return None
+
+
 def compile_expr(element, block, compiler_env):
     """
     Compiles a Fluent expression into a Python one, return
@@ -658,38 +691,85 @@ def compile_expr(element, block, compiler_env):
     to be a function that returns a message, or a branch of that
     function.
     """
-    raise NotImplementedError(f"Cannot handle object of type {type(element).__name__}")
+    node_type = type(element)
+    handler = COMPILE_EXPR_HANDLERS.get(node_type)
+    if handler is None:
+        handler = lookup_compile_expr_handler(node_type)
+        if handler is None:
+            raise NotImplementedError(f"Cannot handle object of type {node_type.__name__}")
+    return handler(element, block, compiler_env)
 
 
-@compile_expr.register(Message)
+@register_compile_expr(Message)
 def compile_expr_message(message, block, compiler_env):
     return compile_expr(message.value, block, compiler_env)
 
 
-@compile_expr.register(Term)
+@register_compile_expr(Term)
 def compile_expr_term(term, block, compiler_env):
     return compile_expr(term.value, block, compiler_env)
 
 
-@compile_expr.register(Attribute)
+@register_compile_expr(Attribute)
 def compile_expr_attribute(attribute, block, compiler_env):
     return compile_expr(attribute.value, block, compiler_env)
 
 
-@compile_expr.register(Pattern)
+def get_pattern_elements_info(pattern):
+    """
+    Returns a list of (is_text, element) tuples for the elements of a Pattern.
+
+    This is cached on the Pattern, because terms are compiled again for every
+    reference to them.
+    """
+    elements_info = getattr(pattern, "_elements_info", None)
+    if elements_info is None:
+        elements_info = [(isinstance(element, TextElement), element) for element in pattern.elements]
+        pattern._elements_info = elements_info
+    return elements_info
+
+
+def get_pattern_constant(pattern):
+    """
+    Returns the text of a Pattern that consists only of TextElements, or None
+    for any other Pattern.
+
+    This is cached on the Pattern.
+    """
+    try:
+        return pattern._const
+    except AttributeError:
+        pass
+    elements_info = get_pattern_elements_info(pattern)
+    if all(is_text for is_text, element in elements_info):
+        const = "".join(element.value for is_text, element in elements_info)
+    else:
+        const = None
+    pattern._const = const
+    return const
+
+
+@register_compile_expr(Pattern)
 def compile_expr_pattern(pattern, block, compiler_env):
-    parts = []
-    subelements = pattern.elements
+    const = get_pattern_constant(pattern)
+    if const is not None:
+        # Just text, which needs no isolating or joining.
+        # > '$const'
+        return finalize_expr_as_output_type(
+            wrap_with_mark_escaped(codegen.String(const), block, compiler_env), block, compiler_env
+        )
 
-    use_isolating = compiler_env.should_use_isolating() and len(subelements) > 1
+    elements_info = get_pattern_elements_info(pattern)
+    if len(elements_info) == 1:
+        # Very common case of a single Placeable, which never needs isolating
+        # or joining.
+        return finalize_expr_as_output_type(compile_expr(elements_info[0][1], block, compiler_env), block, compiler_env)
 
-    for element in pattern.elements:
-        wrap_this_with_isolating = use_isolating and not isinstance(element, TextElement)
-        if wrap_this_with_isolating:
-            parts.append(wrap_with_escaper(codegen.String(FSI), block, compiler_env))
-        parts.append(compile_expr(element, block, compiler_env))
-        if wrap_this_with_isolating:
-            parts.append(wrap_with_escaper(codegen.String(PDI), block, compiler_env))
+    if not compiler_env.should_use_isolating():
+        # No per-element checks are needed.
+        parts = [compile_expr(element, block, compiler_env) for is_text, element in elements_info]
+    else:
+        parts = compile_isolated_pattern_parts(elements_info, block, compiler_env)
 
     # > f'$[p for p in parts]'
     return EscaperJoin.build(
@@ -699,29 +779,52 @@ def compile_expr_pattern(pattern, block, compiler_env):
     )
 
 
-@compile_expr.register(TextElement)
+def compile_isolated_pattern_parts(elements_info, block, compiler_env):
+    parts = []
+    null_escaping = compiler_env.current.escaper is null_escaper
+    for is_text, element in elements_info:
+        part = compile_expr(element, block, compiler_env)
+        # Isolating an empty string does nothing, so we skip it.
+        if is_text or is_empty_string(part):
+            parts.append(part)
+        elif null_escaping and isinstance(part, codegen.String):
+            # Static string, e.g. from an inlined term - we can add the
+            # isolating chars now, creating a single string part.
+            parts.append(codegen.String(FSI + part.string_value + PDI))
+        else:
+            parts.extend(
+                (
+                    wrap_with_escaper(codegen.String(FSI), block, compiler_env),
+                    part,
+                    wrap_with_escaper(codegen.String(PDI), block, compiler_env),
+                )
+            )
+    return parts
+
+
+@register_compile_expr(TextElement)
 def compile_expr_text(text, block, compiler_env):
     return wrap_with_mark_escaped(codegen.String(text.value), block, compiler_env)
 
 
-@compile_expr.register(StringLiteral)
+@register_compile_expr(StringLiteral)
 def compile_expr_string_expression(expr, block, compiler_env):
     return codegen.String(expr.parse()["value"])
 
 
-@compile_expr.register(NumberLiteral)
+@register_compile_expr(NumberLiteral)
 def compile_expr_number_expression(expr, block, compiler_env):
     number_expr = codegen.Number(numeric_to_native(expr.value))
     # > NUMBER($number_expr)
     return codegen.FunctionCall(BUILTIN_NUMBER, [number_expr], {}, block.scope)
 
 
-@compile_expr.register(Placeable)
+@register_compile_expr(Placeable)
 def compile_expr_placeable(placeable, block, compiler_env):
     return compile_expr(placeable.expression, block, compiler_env)
 
 
-@compile_expr.register(MessageReference)
+@register_compile_expr(MessageReference)
 def compile_expr_message_reference(reference, block, compiler_env):
     return handle_message_reference(reference, block, compiler_env)
 
@@ -744,18 +847,17 @@ def compile_term(term, block, compiler_env, new_escaper, term_args=None):
                 return compile_expr(term.value, block, compiler_env)
 
 
-@compile_expr.register(TermReference)
+@register_compile_expr(TermReference)
 def compile_expr_term_reference(reference, block, compiler_env):
     term, new_escaper, err_obj = lookup_term_reference(reference, block, compiler_env)
     if term is None:
         return err_obj
     if reference.arguments:
-        args = [compile_expr(arg, block, compiler_env) for arg in reference.arguments.positional]
-        kwargs = {
-            kwarg.name.name: compile_expr(kwarg.value, block, compiler_env) for kwarg in reference.arguments.named
-        }
+        kwargs = compile_named_args(reference.arguments, block, compiler_env)
 
-        if args:
+        # Positional arguments are ignored, so we don't compile them, which
+        # would add code (e.g. external argument lookups) for no purpose.
+        if reference.arguments.positional:
             args_err = FluentFormatError(
                 "{}: Ignored positional arguments passed to term '{}'".format(
                     display_ast_location(reference.arguments, compiler_env),
@@ -770,7 +872,7 @@ def compile_expr_term_reference(reference, block, compiler_env):
     return compile_term(term, block, compiler_env, new_escaper, term_args=kwargs)
 
 
-@compile_expr.register(SelectExpression)
+@register_compile_expr(SelectExpression)
 def compile_expr_select_expression(select_expr, block, compiler_env):
     with compiler_env.modified(in_select_expression=True):
         key_value = compile_expr(select_expr.selector, block, compiler_env)
@@ -783,7 +885,8 @@ def compile_expr_select_expression(select_expr, block, compiler_env):
 
     return_tmp_name = block.scope.reserve_name("_ret")
 
-    need_plural_form = any(is_cldr_plural_form_key(variant.key) for variant in select_expr.variants)
+    identifier_variants, number_variants, _ = get_select_variants_info(select_expr)
+    need_plural_form = any(name in CLDR_PLURAL_FORMS for name in identifier_variants)
     if need_plural_form:
         plural_form_value = codegen.FunctionCall(
             PLURAL_FORM_FOR_NUMBER_NAME,
@@ -796,12 +899,18 @@ def compile_expr_select_expression(select_expr, block, compiler_env):
 
     assigned_types = []
     first = True
-    for variant in select_expr.variants:
+    for index, variant in enumerate(select_expr.variants):
         if variant.default:
             # This is the default, so gets chosen if nothing else matches, or
             # there was no requested variant. Therefore we use the final 'else'
             # block with no condition.
             cur_block = if_statement.else_block
+        elif variant_is_shadowed(variant, index, identifier_variants, number_variants):
+            # An earlier variant has an equal key, so this one can never match.
+            # We still compile it, into a block that is thrown away, so that
+            # errors in it are reported.
+            compile_expr(variant.value, codegen.Block(block.scope, parent_block=block), compiler_env)
+            continue
         else:
             # For cases like:
             #    { $arg ->
@@ -842,13 +951,13 @@ def compile_expr_select_expression(select_expr, block, compiler_env):
     return block.scope.variable(return_tmp_name)
 
 
-@compile_expr.register(Identifier)
+@register_compile_expr(Identifier)
 def compile_expr_variant_name(name, block, compiler_env):
     # TODO - handle numeric literals here?
     return codegen.String(name.name)
 
 
-@compile_expr.register(VariableReference)
+@register_compile_expr(VariableReference)
 def compile_expr_variable_reference(argument, block, compiler_env):
     name = argument.id.name
     if compiler_env.current.term_args is not None:
@@ -955,17 +1064,18 @@ def compile_expr_variable_reference(argument, block, compiler_env):
     return block.scope.variable(arg_handled_tmp_name)
 
 
-@compile_expr.register(FunctionReference)
+@register_compile_expr(FunctionReference)
 def compile_expr_function_reference(expr, block, compiler_env):
-    args = [compile_expr(arg, block, compiler_env) for arg in expr.arguments.positional]
-    kwargs = {kwarg.name.name: compile_expr(kwarg.value, block, compiler_env) for kwarg in expr.arguments.named}
+    positional = expr.arguments.positional
+    args = [compile_expr(arg, block, compiler_env) for arg in positional] if positional else EMPTY_ARGS
+    kwargs = compile_named_args(expr.arguments, block, compiler_env)
 
     # builtin or custom function
     function_name = expr.id.name
 
     if function_name in compiler_env.functions:
-        match, sanitized_args, sanitized_kwargs, errors = args_match(
-            function_name, args, kwargs, compiler_env.functions_arg_spec[function_name]
+        match, sanitized_args, sanitized_kwargs, errors = compiler_env.function_args_validators[function_name](
+            args, kwargs
         )
         for error in errors:
             add_static_msg_error(block, error)
@@ -999,6 +1109,12 @@ def compile_expr_function_reference(expr, block, compiler_env):
 # Compiler utilities and common code:
 
 
+def compile_named_args(call_arguments, block, compiler_env):
+    if not call_arguments.named:
+        return EMPTY_KWARGS
+    return {kwarg.name.name: compile_expr(kwarg.value, block, compiler_env) for kwarg in call_arguments.named}
+
+
 def add_msg_error_with_expr(block, exception_expr):
     block.add_statement(codegen.MethodCall(block.scope.variable(ERRORS_NAME), "append", [exception_expr]))
 
@@ -1112,46 +1228,72 @@ def is_NUMBER_call_expr(expr):
     return isinstance(expr, FunctionReference) and expr.id.name == "NUMBER"
 
 
+def lookup_reference(ref, compiler_env):
+    """
+    Given a MessageReference or TermReference, returns a tuple:
+    (reference id, id of the target message/term or None, target AST node or None)
+
+    For a reference to an unknown attribute, the target is the parent
+    message/term, if that exists.
+
+    The result is cached on the reference node, because references are looked
+    up many times, by the cycle checker and every time a term is inlined.
+    """
+    cache = getattr(ref, "_lookup_cache", None)
+    if cache is not None and cache[0] is compiler_env:
+        return cache[1]
+
+    # Term IDs always start with TERM_SIGIL, so we can search both dicts for
+    # either type of reference.
+    message_ids_to_ast = compiler_env.message_ids_to_ast
+    term_ids_to_ast = compiler_env.term_ids_to_ast
+    # The ID doesn't depend on compiler_env, so it is cached separately.
+    ref_id = getattr(ref, "_ref_id", None)
+    if ref_id is None:
+        ref_id = ref._ref_id = reference_to_id(ref)
+    target_id = None
+    if ref_id in message_ids_to_ast or ref_id in term_ids_to_ast:
+        target_id = ref_id
+    elif ref.attribute:
+        # Fallback to parent
+        parent_id = reference_to_id(ref, ignore_attributes=True)
+        if parent_id in message_ids_to_ast or parent_id in term_ids_to_ast:
+            target_id = parent_id
+
+    if target_id is None:
+        retval = (ref_id, None, None)
+    else:
+        target = message_ids_to_ast[target_id] if target_id in message_ids_to_ast else term_ids_to_ast[target_id]
+        retval = (ref_id, target_id, target)
+    ref._lookup_cache = (compiler_env, retval)
+    return retval
+
+
 def lookup_term_reference(ref, block, compiler_env):
     # This could be turned into 'handle_term_reference', (similar to
     # 'handle_message_reference' below) once VariantList and VariantExpression
     # go away.
-    term_id = reference_to_id(ref)
-    if term_id in compiler_env.term_ids_to_ast:
-        return (
-            compiler_env.term_ids_to_ast[term_id],
-            compiler_env.escaper_for_message(term_id),
-            None,
-        )
-        return compiler_env.term_ids_to_ast[term_id], None
-    # Fallback to parent
-    if ref.attribute:
-        parent_id = reference_to_id(ref, ignore_attributes=True)
-        if parent_id in compiler_env.term_ids_to_ast:
-            error = unknown_reference_error_obj(term_id, ref, compiler_env)
-            add_static_msg_error(block, error)
-            compiler_env.add_current_message_error(error)
-            return (
-                compiler_env.term_ids_to_ast[parent_id],
-                compiler_env.escaper_for_message(parent_id),
-                None,
-            )
-    return None, None, unknown_reference(term_id, block, ref, compiler_env)
+    term_id, target_id, term = lookup_reference(ref, compiler_env)
+    if term is None:
+        return None, None, unknown_reference(term_id, block, ref, compiler_env)
+    if target_id != term_id:
+        # Fallback to parent
+        error = unknown_reference_error_obj(term_id, ref, compiler_env)
+        add_static_msg_error(block, error)
+        compiler_env.add_current_message_error(error)
+    return term, compiler_env.escaper_for_message(target_id), None
 
 
 def handle_message_reference(ref, block, compiler_env):
-    msg_id = reference_to_id(ref)
-    if msg_id in compiler_env.message_ids_to_ast:
-        return do_message_call(msg_id, block, compiler_env)
-    # Fallback to parent
-    if ref.attribute:
-        parent_id = reference_to_id(ref, ignore_attributes=True)
-        if parent_id in compiler_env.message_ids_to_ast:
-            error = unknown_reference_error_obj(msg_id, ref, compiler_env)
-            add_static_msg_error(block, error)
-            compiler_env.add_current_message_error(error)
-            return do_message_call(parent_id, block, compiler_env)
-    return unknown_reference(msg_id, block, ref, compiler_env)
+    msg_id, target_id, msg = lookup_reference(ref, compiler_env)
+    if msg is None:
+        return unknown_reference(msg_id, block, ref, compiler_env)
+    if target_id != msg_id:
+        # Fallback to parent
+        error = unknown_reference_error_obj(msg_id, ref, compiler_env)
+        add_static_msg_error(block, error)
+        compiler_env.add_current_message_error(error)
+    return do_message_call(target_id, block, compiler_env)
 
 
 def make_fluent_none(name, scope):
@@ -1189,6 +1331,44 @@ def reserve_and_assign_name(block, suggested_name, value):
     return name
 
 
+def get_select_variants_info(select_expr):
+    """
+    Returns a tuple for a SelectExpression:
+
+    (dict of identifier key names to (index, variant),
+     dict of numeric key values to (index, variant),
+     default variant)
+
+    Only the first variant for each key is included, since that is the one
+    that will match. This is cached on the SelectExpression.
+    """
+    variants_info = getattr(select_expr, "_variants_info", None)
+    if variants_info is None:
+        identifier_variants = {}
+        number_variants = {}
+        default_variant = None
+        for index, variant in enumerate(select_expr.variants):
+            if variant.default:
+                default_variant = variant
+            if isinstance(variant.key, Identifier):
+                identifier_variants.setdefault(variant.key.name, (index, variant))
+            elif isinstance(variant.key, NumberLiteral):
+                number_variants.setdefault(numeric_to_native(variant.key.value), (index, variant))
+        variants_info = (identifier_variants, number_variants, default_variant)
+        select_expr._variants_info = variants_info
+    return variants_info
+
+
+def variant_is_shadowed(variant, index, identifier_variants, number_variants):
+    """
+    Returns True if the variant at `index` has the same key as an earlier
+    variant, using the dictionaries from get_select_variants_info.
+    """
+    if isinstance(variant.key, Identifier):
+        return identifier_variants[variant.key.name][0] != index
+    return number_variants[numeric_to_native(variant.key.value)][0] != index
+
+
 def resolve_select_expression_statically(select_expr, key_ast, block, compiler_env):
     """
     Resolve a select expression statically, given a codegen.PythonAst object
@@ -1202,38 +1382,26 @@ def resolve_select_expression_statically(select_expr, key_ast, block, compiler_e
     if not (key_is_string or key_is_number or key_is_fluent_none):
         return None
 
-    if key_is_number:
+    identifier_variants, number_variants, default_variant = get_select_variants_info(select_expr)
+    if key_is_fluent_none:
+        found = None
+    elif key_is_string:
+        found = identifier_variants.get(key_ast.string_value)
+    else:
         if isinstance(key_ast, codegen.Number):
             key_number_value = key_ast.number
         else:
             # peek into the number literal inside the `NUMBER` call.
             key_number_value = key_ast.args[0].number
-
-    default_variant = None
-    found = None
-    for variant in select_expr.variants:
-        if variant.default:
-            default_variant = variant
-            if key_is_fluent_none:
-                found = variant
-                break
-        if key_is_string:
-            if isinstance(variant.key, Identifier) and key_ast.string_value == variant.key.name:
-                found = variant
-                break
-        elif key_is_number:
-            if isinstance(variant.key, NumberLiteral) and key_number_value == numeric_to_native(variant.key.value):
-                found = variant
-                break
-            elif (
-                isinstance(variant.key, Identifier)
-                and compiler_env.plural_form_function(key_number_value) == variant.key.name
-            ):
-                found = variant
-                break
-    if found is None:
-        found = default_variant
-
+        # A number can match either a numeric key or a plural category key,
+        # and the first matching variant wins.
+        found = number_variants.get(key_number_value)
+        if identifier_variants:
+            plural_form_match = identifier_variants.get(compiler_env.plural_form_function(key_number_value))
+            if plural_form_match is not None and (found is None or plural_form_match[0] < found[0]):
+                found = plural_form_match
+
+    found = default_variant if found is None else found[1]
     return compile_expr(found.value, block, compiler_env)
 
 
@@ -1283,6 +1451,10 @@ def is_DATETIME_function_call(codegen_ast):
     return isinstance(codegen_ast, codegen.FunctionCall) and codegen_ast.function_name == BUILTIN_DATETIME
 
 
+def is_empty_string(codegen_ast):
+    return isinstance(codegen_ast, codegen.String) and codegen_ast.string_value == ""
+
+
 def is_fluent_none(codegen_ast):
     return (
         isinstance(codegen_ast, codegen.ObjectCreation)
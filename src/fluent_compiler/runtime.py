@@ -27,10 +27,24 @@ RETURN_TYPES = {
 }
 
 
+# Exact types of common arguments, for fast checks with `type(arg) in ...`,
+# which avoids the cost of `isinstance` with a tuple of types that don't match.
+# Subclasses still get handled by the `isinstance` checks.
+NUMBER_TYPES = frozenset([int, float, Decimal])
+DATE_TYPES = frozenset([date, datetime])
+
+
 def handle_argument_with_escaper(arg, name, output_type, locale, errors):
     # This needs to be synced with resolver.handle_variable_reference
     if isinstance(arg, output_type):
         return arg
+    arg_type = type(arg)
+    if arg_type is str:
+        return arg
+    elif arg_type in NUMBER_TYPES:
+        return fluent_number(arg)
+    elif arg_type in DATE_TYPES:
+        return fluent_date(arg)
     if isinstance(arg, str):
         return arg
     elif isinstance(arg, (int, float, Decimal)):
@@ -44,6 +58,13 @@ def handle_argument_with_escaper(arg, name, output_type, locale, errors):
 def handle_argument(arg, name, locale, errors):
     # handle_argument_with_escaper specialized to null escaper
     # This needs to be synced with resolver.handle_variable_reference
+    arg_type = type(arg)
+    if arg_type is str:
+        return arg
+    elif arg_type in NUMBER_TYPES:
+        return fluent_number(arg)
+    elif arg_type in DATE_TYPES:
+        return fluent_date(arg)
     if isinstance(arg, str):
         return arg
     elif isinstance(arg, (int, float, Decimal)):
@@ -55,6 +76,11 @@ def handle_argument(arg, name, locale, errors):
 
 
 def handle_output_with_escaper(val, output_type, escaper_escape, locale, errors):
+    val_type = type(val)
+    if val_type is output_type:
+        return val
+    elif val_type is str:
+        return escaper_escape(val)
     if isinstance(val, output_type):
         return val
     elif isinstance(val, str):
@@ -2,6 +2,8 @@ import builtins
 import inspect
 import keyword
 import re
+import sys
+import weakref
 
 from fluent.syntax.ast import Term, TermReference
 
@@ -31,20 +33,25 @@ def allowable_keyword_arg_name(name):
     return NAMED_ARG_RE.match(name)
 
 
+# The *_to_id functions below return interned strings, because the IDs are used
+# as dictionary keys, and interning allows lookups to succeed on the identity
+# check rather than needing string comparison.
+
+
 def ast_to_id(ast):
     """
     Returns a string reference for a Term or Message
     """
     if isinstance(ast, Term):
-        return TERM_SIGIL + ast.id.name
-    return ast.id.name
+        return sys.intern(TERM_SIGIL + ast.id.name)
+    return sys.intern(ast.id.name)
 
 
 def attribute_ast_to_id(attribute, parent_ast):
     """
     Returns a string reference for an Attribute, given Attribute and parent Term or Message
     """
-    return "".join([ast_to_id(parent_ast), ATTRIBUTE_SEPARATOR, attribute.id.name])
+    return sys.intern("".join([ast_to_id(parent_ast), ATTRIBUTE_SEPARATOR, attribute.id.name]))
 
 
 def allowable_name(ident, for_method=False, allow_builtin=False):
@@ -73,6 +80,24 @@ def inspect_function_args(function, name, errors):
     """
     if hasattr(function, "ftl_arg_spec"):
         return sanitize_function_args(function.ftl_arg_spec, name, errors)
+    return sanitize_function_args(signature_arg_spec(function), name, errors)
+
+
+# Cache for signature_arg_spec, because the same functions are usually passed
+# in for every locale, and inspect.signature is slow.
+_SIGNATURE_ARG_SPEC_CACHE = weakref.WeakKeyDictionary()
+
+
+def signature_arg_spec(function):
+    """
+    Returns the (unsanitized) arg spec for a function, derived from its signature.
+    """
+    try:
+        return _SIGNATURE_ARG_SPEC_CACHE[function]
+    except (KeyError, TypeError):
+        # TypeError for objects that are unhashable or can't be weakly referenced.
+        pass
+
     sig = inspect.signature(function)
     parameters = list(sig.parameters.values())
 
@@ -91,61 +116,66 @@ def inspect_function_args(function, name, errors):
     keywords = (
         Any
         if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
-        else [p.name for p in parameters if p.default != inspect.Parameter.empty]
+        else tuple(p.name for p in parameters if p.default != inspect.Parameter.empty)
     )
-    return sanitize_function_args((positional, keywords), name, errors)
+    arg_spec = (positional, keywords)
+    try:
+        _SIGNATURE_ARG_SPEC_CACHE[function] = arg_spec
+    except TypeError:
+        pass
+    return arg_spec
 
 
-def args_match(function_name, args, kwargs, arg_spec):
+def make_args_validator(function_name, arg_spec):
     """
-    Checks the passed in args/kwargs against the function arg_spec
-    and returns data for calling the function correctly.
+    Returns a function that checks passed in (args, kwargs) against the
+    function arg_spec and returns data for calling the function correctly.
 
-    Return value is a tuple
+    Return value of the returned function is a tuple
 
     (match, santized args, santized keyword args, errors)
 
     match is False if the function should not be called at all.
 
+    The arg_spec is processed once here, rather than for every check.
     """
+    positional_arg_count, allowed_kwargs = arg_spec
+    if allowed_kwargs is Any:
+        kwarg_allowed = allowable_keyword_arg_name
+    else:
+        kwarg_allowed = frozenset(allowed_kwargs).__contains__
+
     # For the errors returned, we try to match the TypeError raised by Python
     # when calling functions with wrong arguments, for the sake of something
     # recognisable.
-    errors = []
-    sanitized_kwargs = {}
-    positional_arg_count, allowed_kwargs = arg_spec
-    match = True
-    for kwarg_name, kwarg_val in kwargs.items():
-        if (allowed_kwargs is Any and allowable_keyword_arg_name(kwarg_name)) or (
-            allowed_kwargs is not Any and kwarg_name in allowed_kwargs
-        ):
-            sanitized_kwargs[kwarg_name] = kwarg_val
+    def validate(args, kwargs):
+        errors = []
+        sanitized_kwargs = {}
+        match = True
+        for kwarg_name, kwarg_val in kwargs.items():
+            if kwarg_allowed(kwarg_name):
+                sanitized_kwargs[kwarg_name] = kwarg_val
+            else:
+                errors.append(TypeError(f"{function_name}() got an unexpected keyword argument '{kwarg_name}'"))
+        if positional_arg_count is Any:
+            sanitized_args = args
         else:
-            errors.append(TypeError(f"{function_name}() got an unexpected keyword argument '{kwarg_name}'"))
-    if positional_arg_count is Any:
-        sanitized_args = args
-    else:
-        sanitized_args = tuple(args[0:positional_arg_count])
-        len_args = len(args)
-        if len_args > positional_arg_count:
-            errors.append(
-                TypeError(
-                    "{}() takes {} positional arguments but {} were given".format(
-                        function_name, positional_arg_count, len_args
+            sanitized_args = tuple(args[0:positional_arg_count])
+            len_args = len(args)
+            if len_args != positional_arg_count:
+                errors.append(
+                    TypeError(
+                        "{}() takes {} positional arguments but {} were given".format(
+                            function_name, positional_arg_count, len_args
+                        )
                     )
                 )
-            )
-        elif len_args < positional_arg_count:
-            errors.append(
-                TypeError(
-                    "{}() takes {} positional arguments but {} were given".format(
-                        function_name, positional_arg_count, len_args
-                    )
-                )
-            )
-            match = False
+                if len_args < positional_arg_count:
+                    match = False
+
+        return (match, sanitized_args, sanitized_kwargs, errors)
 
-    return (match, sanitized_args, sanitized_kwargs, errors)
+    return validate
 
 
 def reference_to_id(ref, ignore_attributes=False):
@@ -165,8 +195,8 @@ def reference_to_id(ref, ignore_attributes=False):
         start = ref.id.name
 
     if not ignore_attributes and ref.attribute:
-        return "".join([start, ATTRIBUTE_SEPARATOR, ref.attribute.name])
-    return start
+        return sys.intern("".join([start, ATTRIBUTE_SEPARATOR, ref.attribute.name]))
+    return sys.intern(start)
 
 
 def sanitize_function_args(arg_spec, name, errors):
@@ -55,6 +55,7 @@ class TestSkipIsolating(unittest.TestCase):
             -brand-short-name = Amaya
             foo = { -brand-short-name }
             with-arg = { $arg }
+            empty = Foo { "" } Bar
         """
             ),
         )
@@ -68,3 +69,8 @@ class TestSkipIsolating(unittest.TestCase):
         val, errs = self.bundle.format("with-arg", {"arg": "Arg"})
         self.assertEqual(val, "Arg")
         self.assertEqual(errs, [])
+
+    def test_skip_isolating_chars_for_empty_string(self):
+        val, errs = self.bundle.format("empty", {})
+        self.assertEqual(val, "Foo  Bar")
+        self.assertEqual(errs, [])
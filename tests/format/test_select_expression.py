@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 
 from fluent_compiler.bundle import FluentBundle
 from fluent_compiler.errors import FluentReferenceError
@@ -70,6 +71,24 @@ class TestSelectExpressionWithStrings(unittest.TestCase):
         val, errs = bundle.format("foo", {"arg": "a"})
         self.assertEqual(val, "A")
 
+    def test_duplicate_of_default_key(self):
+        bundle = FluentBundle.from_string(
+            "en-US",
+            dedent_ftl(
+                """
+            foo = { $arg ->
+               *[a] A
+                [a] B
+                [b] C
+             }
+        """
+            ),
+        )
+        # The first matching variant wins, even if it is the default.
+        val, errs = bundle.format("foo", {"arg": "a"})
+        self.assertEqual(val, "A")
+        self.assertEqual(errs, [])
+
     def test_string_selector_with_plural_categories(self):
         bundle = FluentBundle.from_string(
             "en-US",
@@ -253,6 +272,18 @@ class TestSelectExpressionWithPluralCategories(unittest.TestCase):
                *[other] B
              }
 
+            plural-first = { 1 ->
+                [one] A
+                [1] B
+               *[other] C
+             }
+
+            number-first = { 1 ->
+                [1] A
+                [one] B
+               *[other] C
+             }
+
         """
             ),
             use_isolating=False,
@@ -282,6 +313,12 @@ class TestSelectExpressionWithPluralCategories(unittest.TestCase):
         self.assertEqual(val, "A")
         self.assertEqual(errs, [])
 
+    def test_selects_the_right_category_with_decimal_runtime(self):
+        # Decimal("1") and Decimal("1.0") are equal, but have different plural
+        # forms in English.
+        self.assertEqual(self.bundle.format("foo-arg", {"count": Decimal("1")}), ("A", []))
+        self.assertEqual(self.bundle.format("foo-arg", {"count": Decimal("1.0")}), ("B", []))
+
     def test_selects_exact_match_static(self):
         val, errs = self.bundle.format("bar", {})
         self.assertEqual(val, "A")
@@ -292,6 +329,10 @@ class TestSelectExpressionWithPluralCategories(unittest.TestCase):
         self.assertEqual(val, "A")
         self.assertEqual(errs, [])
 
+    def test_selects_first_matching_variant_static(self):
+        self.assertEqual(self.bundle.format("plural-first", {}), ("A", []))
+        self.assertEqual(self.bundle.format("number-first", {}), ("A", []))
+
     def test_selects_default_with_invalid_selector_static(self):
         val, errs = self.bundle.format("baz", {})
         self.assertEqual(val, "B")
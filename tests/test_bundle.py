@@ -1,5 +1,8 @@
 import traceback
 import unittest
+from unittest import mock
+
+from markupsafe import Markup, escape
 
 from fluent_compiler.bundle import FluentBundle, FtlResource
 from fluent_compiler.errors import FluentDuplicateMessageId, FluentJunkFound, FluentReferenceError
@@ -12,12 +15,10 @@ class TestFluentBundle(unittest.TestCase):
     def test_has_message(self):
         bundle = FluentBundle.from_string(
             "en-US",
-            dedent_ftl(
-                """
+            dedent_ftl("""
             foo = Foo
             -term = Term
-        """
-            ),
+        """),
         )
 
         self.assertTrue(bundle.has_message("foo"))
@@ -26,11 +27,9 @@ class TestFluentBundle(unittest.TestCase):
     def test_has_message_for_term(self):
         bundle = FluentBundle.from_string(
             "en-US",
-            dedent_ftl(
-                """
+            dedent_ftl("""
             -foo = Foo
-        """
-            ),
+        """),
         )
 
         self.assertFalse(bundle.has_message("-foo"))
@@ -38,12 +37,10 @@ class TestFluentBundle(unittest.TestCase):
     def test_has_message_with_attribute(self):
         bundle = FluentBundle.from_string(
             "en-US",
-            dedent_ftl(
-                """
+            dedent_ftl("""
             foo = Foo
                 .attr = Foo Attribute
-        """
-            ),
+        """),
         )
 
         self.assertTrue(bundle.has_message("foo"))
@@ -65,24 +62,86 @@ class TestFluentBundle(unittest.TestCase):
     def test_format_term(self):
         bundle = FluentBundle.from_string(
             "en-US",
-            dedent_ftl(
-                """
+            dedent_ftl("""
             -foo = Foo
-        """
-            ),
+        """),
         )
         self.assertRaises(LookupError, bundle.format, "-foo")
         self.assertRaises(LookupError, bundle.format, "foo")
 
+    def test_format_cached(self):
+        bundle = FluentBundle.from_string(
+            "en-US", "foo = Foo { $arg } { $missing }", use_isolating=False, cache_format=True
+        )
+        message_function = mock.Mock(wraps=bundle._compiled_messages["foo"])
+        with mock.patch.dict(bundle._compiled_messages, {"foo": message_function}):
+            val, errs = bundle.format("foo", {"arg": 1})
+            self.assertEqual(val, "Foo 1 missing")
+            errs[0].args = ("Changed by caller",)
+            errs.append("Changed by caller")
+
+            val, errs = bundle.format("foo", {"arg": 1})
+            self.assertEqual(val, "Foo 1 missing")
+            self.assertEqual(errs, [FluentReferenceError("<string>:1:22: Unknown external: missing")])
+            self.assertEqual(message_function.call_count, 1)
+
+            # Floats are not cached.
+            self.assertEqual(bundle.format("foo", {"arg": 1.5})[0], "Foo 1.5 missing")
+            self.assertEqual(bundle.format("foo", {"arg": 1.5})[0], "Foo 1.5 missing")
+            self.assertEqual(message_function.call_count, 3)
+
+    def test_format_not_cached_by_default(self):
+        bundle = FluentBundle.from_string("en-US", "foo = Foo")
+        message_function = mock.Mock(wraps=bundle._compiled_messages["foo"])
+        with mock.patch.dict(bundle._compiled_messages, {"foo": message_function}):
+            self.assertEqual(bundle.format("foo")[0], "Foo")
+            self.assertEqual(bundle.format("foo")[0], "Foo")
+        self.assertEqual(message_function.call_count, 2)
+
+    def test_format_not_cached_with_custom_functions(self):
+        calls = []
+
+        def COUNT():
+            calls.append(None)
+            return str(len(calls))
+
+        bundle = FluentBundle.from_string("en-US", "foo = { COUNT() }", functions={"COUNT": COUNT}, cache_format=True)
+        self.assertEqual(bundle.format("foo")[0], "1")
+        self.assertEqual(bundle.format("foo")[0], "2")
+
+    def test_format_not_cached_with_escapers(self):
+        class CountingEscaper:
+            name = "CountingEscaper"
+            output_type = Markup
+            use_isolating = False
+            calls = 0
+
+            def select(self, message_id=None, **hints):
+                return True
+
+            def mark_escaped(self, escaped):
+                return Markup(escaped)
+
+            def escape(self, unescaped):
+                self.calls += 1
+                return escape(unescaped)
+
+            def join(self, parts):
+                return Markup("").join(parts)
+
+        escaper = CountingEscaper()
+        bundle = FluentBundle.from_string("en-US", "foo = { $arg }", escapers=[escaper], cache_format=True)
+        self.assertEqual(bundle.format("foo", {"arg": "<b>"})[0], Markup("&lt;b&gt;"))
+        self.assertEqual(bundle.format("foo", {"arg": "<b>"})[0], Markup("&lt;b&gt;"))
+        self.assertEqual(escaper.calls, 2)
+
     def test_message_and_term_separate(self):
         bundle = FluentBundle.from_string(
             "en-US",
-            dedent_ftl(
-                """
+            dedent_ftl("""
             foo = Refers to { -foo }
             -foo = Foo
-        """
-            ),
+        """),
         )
         val, errs = bundle.format("foo", {})
         self.assertEqual(val, "Refers to \u2068Foo\u2069")
@@ -118,12 +177,10 @@ class TestFluentBundle(unittest.TestCase):
             "en-US",
             [
                 FtlResource(
-                    dedent_ftl(
-                        """
+                    dedent_ftl("""
         foo = { -missing }
             .bar = { -missing }
-        """
-                    ),
+        """),
                     filename="myfile.ftl",
                 )
             ],
@@ -145,20 +202,16 @@ class TestFluentBundle(unittest.TestCase):
             "en-US",
             [
                 FtlResource(
-                    dedent_ftl(
-                        """
+                    dedent_ftl("""
             foo = { $arg }
-            """
-                    ),
+            """),
                     filename="firstfile.ftl",
                 ),
                 FtlResource(
-                    dedent_ftl(
-                        """
+                    dedent_ftl("""
 
             bar = { $arg }
-            """
-                    ),
+            """),
                     filename="secondfile.ftl",
                 ),
             ],
@@ -559,3 +559,31 @@ class TestCodeGen(unittest.TestCase):
     def test_or(self):
         or_ = codegen.Or(codegen.String("x"), codegen.String("y"))
         self.assertCodeEqual(as_source_code(or_), "'x' or 'y'")
+
+    def test_rewriting_traverse_order(self):
+        scope = codegen.Scope()
+        scope.reserve_name("func")
+        a, b, c = codegen.String("a"), codegen.String("b"), codegen.String("c")
+        call = codegen.FunctionCall("func", [codegen.Or(a, b)], {"kw": c}, scope)
+        visited = []
+
+        def func(node):
+            visited.append(node)
+            return node
+
+        codegen.rewriting_traverse(call, func)
+        self.assertEqual(
+            [type(node) for node in visited],
+            [codegen.FunctionCall, codegen.Or, codegen.String, codegen.String, codegen.String],
+        )
+        self.assertIs(visited[2], a)
+        self.assertIs(visited[3], b)
+        self.assertIs(visited[4], c)
+
+    def test_rewriting_traverse_deep(self):
+        node = codegen.String("x")
+        for i in range(5000):
+            node = codegen.Or(node, codegen.String("y"))
+        visited = []
+        codegen.rewriting_traverse(node, lambda n: visited.append(n) or n)
+        self.assertEqual(len(visited), 10001)
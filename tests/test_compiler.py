@@ -1,10 +1,11 @@
 import unittest
 from types import SimpleNamespace
 
+from fluent.syntax.ast import Identifier, Pattern, Placeable, StringLiteral, TextElement
 from markupsafe import Markup, escape
 
 from fluent_compiler import codegen
-from fluent_compiler.compiler import compile_messages
+from fluent_compiler.compiler import compile_expr, compile_messages, get_pattern_constant
 from fluent_compiler.errors import FluentCyclicReferenceError, FluentFormatError, FluentReferenceError
 from fluent_compiler.resource import FtlResource
 
@@ -618,6 +619,70 @@ class TestCompiler(CompilerTestMixin, UseConcatJoinMixin, unittest.TestCase):
         )
         self.assertEqual(errs, [])
 
+    def test_select_runtime_duplicate_keys(self):
+        code, errs = compile_messages_to_python(
+            """
+           foo = { $arg ->
+                [a] A
+                [a] B
+                [1] C
+                [1.0] D
+               *[b] E
+             }
+        """,
+            self.locale,
+        )
+        self.assertCodeEqual(
+            code,
+            """
+            def foo(message_args, errors):
+                try:
+                    _arg = message_args['arg']
+                except (LookupError, TypeError):
+                    errors.append(FluentReferenceError('<string>:2:9: Unknown external: arg'))
+                    _arg = FluentNone('arg')
+                if _arg == 'a':
+                    _ret = 'A'
+                elif _arg == 1:
+                    _ret = 'C'
+                else:
+                    _ret = 'E'
+                return _ret
+        """,
+        )
+        self.assertEqual(errs, [])
+
+    def test_select_runtime_duplicate_of_default_key(self):
+        code, errs = compile_messages_to_python(
+            """
+           foo = { $arg ->
+               *[a] A
+                [a] { missing-msg }
+                [b] B
+             }
+        """,
+            self.locale,
+        )
+        # The second [a] variant can never be selected, but errors in it are
+        # still reported.
+        self.assertCodeEqual(
+            code,
+            """
+            def foo(message_args, errors):
+                try:
+                    _arg = message_args['arg']
+                except (LookupError, TypeError):
+                    errors.append(FluentReferenceError('<string>:2:9: Unknown external: arg'))
+                    _arg = FluentNone('arg')
+                if _arg == 'b':
+                    _ret = 'B'
+                else:
+                    _ret = 'A'
+                return _ret
+        """,
+        )
+        self.assertEqual(errs, [("foo", FluentReferenceError("<string>:4:12: Unknown message: missing-msg"))])
+
     def test_select_string_static(self):
         code, errs = compile_messages_to_python(
             """
@@ -797,6 +862,24 @@ class TestCompiler(CompilerTestMixin, UseConcatJoinMixin, unittest.TestCase):
         )
         self.assertEqual(errs, [])
 
+    def test_static_interpolation_isolating(self):
+        code, errs = compile_messages_to_python(
+            """
+            -term = Term
+            foo = Foo { -term } Bar
+        """,
+            self.locale,
+            use_isolating=True,
+        )
+        self.assertCodeEqual(
+            code,
+            """
+            def foo(message_args, errors):
+                return 'Foo \\u2068Term\\u2069 Bar'
+        """,
+        )
+        self.assertEqual(errs, [])
+
     def test_cycle_detection(self):
         code, errs = compile_messages_to_python(
             """
@@ -1014,6 +1097,28 @@ class TestCompiler(CompilerTestMixin, UseConcatJoinMixin, unittest.TestCase):
         """,
         )
 
+    def test_parameterized_terms_positional_args_not_compiled(self):
+        code, errs = compile_messages_to_python(
+            """
+            -thing = The thing
+            foo = { -thing($arg) }
+        """,
+            self.locale,
+        )
+        self.assertCodeEqual(
+            code,
+            """
+            def foo(message_args, errors):
+                errors.append(
+                    FluentFormatError('<string>:3:15: Ignored positional arguments passed to term \\'-thing\\'')
+                )
+                return 'The thing'
+        """,
+        )
+        self.assertEqual(
+            errs, [("foo", FluentFormatError("<string>:3:15: Ignored positional arguments passed to term '-thing'"))]
+        )
+
     def test_message_call_from_inside_term(self):
         # This might get removed sometime, but for now it is a corner case we
         # need to cover.
@@ -1278,3 +1383,25 @@ class TestCompilerEscaping(CompilerTestMixin, unittest.TestCase):
             self.locale,
             escapers=[html_escaper, html_escaper],
         )
+
+
+class TestCompileExprDispatch(unittest.TestCase):
+    def test_subclass_of_registered_type(self):
+        class MyIdentifier(Identifier):
+            pass
+
+        self.assertEqual(compile_expr(MyIdentifier("one"), None, None), codegen.String("one"))
+
+    def test_unknown_type(self):
+        self.assertRaises(NotImplementedError, compile_expr, object(), None, None)
+
+
+class TestGetPatternConstant(unittest.TestCase):
+    def test_text_only(self):
+        pattern = Pattern([TextElement("Hello, "), TextElement("world")])
+        self.assertEqual(get_pattern_constant(pattern), "Hello, world")
+        self.assertEqual(get_pattern_constant(pattern), "Hello, world")
+
+    def test_with_placeable(self):
+        pattern = Pattern([TextElement("Hello, "), Placeable(StringLiteral("world"))])
+        self.assertIsNone(get_pattern_constant(pattern))
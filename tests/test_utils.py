@@ -1,7 +1,11 @@
+import inspect
 import unittest
+from unittest import mock
+
+from fluent.syntax.ast import Attribute, Identifier, Message, MessageReference
 
 from fluent_compiler.errors import FluentFormatError
-from fluent_compiler.utils import Any, inspect_function_args
+from fluent_compiler.utils import Any, attribute_ast_to_id, inspect_function_args, make_args_validator, reference_to_id
 
 
 class TestInspectFunctionArgs(unittest.TestCase):
@@ -33,3 +37,61 @@ class TestInspectFunctionArgs(unittest.TestCase):
             errors,
             [FluentFormatError("FOO() has invalid keyword argument name 'bad kwarg'")],
         )
+
+    def test_inspect_function_args_cached(self):
+        def foo(x, y=1):
+            pass
+
+        with mock.patch("fluent_compiler.utils.inspect.signature", wraps=inspect.signature) as signature:
+            self.assertEqual(inspect_function_args(foo, "FOO", []), (1, ["y"]))
+            self.assertEqual(inspect_function_args(foo, "FOO", []), (1, ["y"]))
+        signature.assert_called_once_with(foo)
+
+    def test_inspect_function_args_not_weakrefable(self):
+        class Foo:
+            __slots__ = ()
+
+            def __call__(self, x, y=1):
+                pass
+
+        foo = Foo()
+        with mock.patch("fluent_compiler.utils.inspect.signature", wraps=inspect.signature) as signature:
+            self.assertEqual(inspect_function_args(foo, "FOO", []), (1, ["y"]))
+            self.assertEqual(inspect_function_args(foo, "FOO", []), (1, ["y"]))
+        # Can't be cached, so the signature is inspected every time.
+        self.assertEqual(signature.call_count, 2)
+
+
+class TestMakeArgsValidator(unittest.TestCase):
+    def test_valid_args(self):
+        validate = make_args_validator("FOO", (1, ["y"]))
+        self.assertEqual(validate((1,), {"y": 2}), (True, (1,), {"y": 2}, []))
+
+    def test_invalid_args(self):
+        validate = make_args_validator("FOO", (1, ["y"]))
+        match, args, kwargs, errors = validate((), {"z": 2})
+        self.assertEqual((match, args, kwargs), (False, (), {}))
+        self.assertEqual(
+            [str(e) for e in errors],
+            [
+                "FOO() got an unexpected keyword argument 'z'",
+                "FOO() takes 1 positional arguments but 0 were given",
+            ],
+        )
+
+    def test_too_many_args(self):
+        validate = make_args_validator("FOO", (1, Any))
+        match, args, kwargs, errors = validate((1, 2), {"anything": 3})
+        self.assertEqual((match, args, kwargs), (True, (1,), {"anything": 3}))
+        self.assertEqual([str(e) for e in errors], ["FOO() takes 1 positional arguments but 2 were given"])
+
+
+class TestIds(unittest.TestCase):
+    def test_reference_ids_are_interned(self):
+        # Build names at runtime to avoid constants interned by the compiler.
+        name = "".join(["my-", "message"])
+        attr_name = "".join(["my-", "attr"])
+        msg = Message(Identifier(name), attributes=[Attribute(Identifier(attr_name), None)])
+        ref = MessageReference(Identifier(name), attribute=Identifier(attr_name))
+        self.assertEqual(reference_to_id(ref), "my-message.my-attr")
+        self.assertIs(reference_to_id(ref), attribute_ast_to_id(msg.attributes[0], msg))